@@ -12,12 +12,7 @@ from datetime import datetime
 PLUGIN_ROOT = os.environ.get('CLAUDE_PLUGIN_ROOT', os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, PLUGIN_ROOT)
 
-from core.cost_calculator import (
-    get_current_month_cost,
-    get_cost_breakdown,
-    get_usage_stats
-)
-from core.usage_parser import get_current_month_usage
+from core.cost_calculator import aggregate_current_month
 
 # Budget configuration
 BUDGET_LIMIT = 15.00  # $15 per month
@@ -31,10 +26,7 @@ def main():
         month_name = now.strftime("%B %Y")
 
         # Get usage data
-        records = get_current_month_usage()
-        current_cost = get_current_month_cost()
-        breakdown = get_cost_breakdown(records)
-        stats = get_usage_stats(records)
+        current_cost, breakdown, stats = aggregate_current_month()
 
         # Calculate stats
         percentage = (current_cost / BUDGET_LIMIT) * 100 if BUDGET_LIMIT > 0 else 0
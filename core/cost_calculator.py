@@ -9,8 +9,12 @@ import sys
 # Add parent directory to path to import sibling modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.pricing import calculate_message_cost, get_model_display_name
-from core.usage_parser import get_current_month_usage
+from core.pricing import calculate_tokens_cost, get_model_display_name
+from core.usage_parser import (
+    get_current_month_summary,
+    get_month_summary,
+    summarize_records
+)
 
 
 def calculate_total_cost(records):
@@ -18,24 +22,108 @@ def calculate_total_cost(records):
     Calculate total cost from a list of usage records.
 
     Args:
-        records: List of usage records (each with 'model' and 'usage' keys)
+        records: Iterable of usage records (each with 'model' and 'usage' keys)
 
     Returns:
         Total cost in dollars (float)
     """
-    total = 0.0
+    return calculate_summary_cost(summarize_records(records))
+
+
+def calculate_summary_cost(totals):
+    """
+    Calculate total cost from per-model usage totals.
 
-    for record in records:
-        model = record.get("model")
-        usage = record.get("usage")
+    Cost is linear in token counts, so pricing each model's summed
+    tokens gives the same result as pricing every message.
+
+    Args:
+        totals: Dict mapping model ID to [api_calls, input, output,
+            cache_write, cache_read] counts
+
+    Returns:
+        Total cost in dollars (float)
+    """
+    total = 0.0
 
-        if model and usage:
-            cost = calculate_message_cost(model, usage)
-            total += cost
+    for model, counts in totals.items():
+        if model:
+            total += calculate_tokens_cost(model, counts[1:])
 
     return total
 
 
+def aggregate_usage_totals(totals):
+    """
+    Compute total cost, model breakdown and usage statistics in one pass.
+
+    Args:
+        totals: Dict mapping model ID to [api_calls, input, output,
+            cache_write, cache_read] counts
+
+    Returns:
+        Tuple of (total_cost, breakdown, stats), matching the results of
+        calculate_total_cost, get_cost_breakdown and get_usage_stats
+    """
+    total = 0.0
+    breakdown = {}
+    stats = {
+        "total_api_calls": 0,
+        "total_input_tokens": 0,
+        "total_output_tokens": 0,
+        "total_cache_write_tokens": 0,
+        "total_cache_read_tokens": 0
+    }
+
+    for model, counts in totals.items():
+        api_calls, input_tokens, output_tokens, cache_write_tokens, cache_read_tokens = counts
+
+        stats["total_api_calls"] += api_calls
+        stats["total_input_tokens"] += input_tokens
+        stats["total_output_tokens"] += output_tokens
+        stats["total_cache_write_tokens"] += cache_write_tokens
+        stats["total_cache_read_tokens"] += cache_read_tokens
+
+        # Records without a model are counted but not priced
+        if not model:
+            continue
+
+        cost = calculate_tokens_cost(model, counts[1:])
+        total += cost
+
+        display_name = get_model_display_name(model)
+        breakdown[display_name] = breakdown.get(display_name, 0.0) + cost
+
+    return total, breakdown, stats
+
+
+def aggregate_current_month():
+    """
+    Get cost, model breakdown and usage statistics for the current month.
+
+    Usage is read once and every figure is derived from the same
+    per-model totals.
+
+    Returns:
+        Tuple of (total_cost, breakdown, stats), see aggregate_usage_totals
+    """
+    return aggregate_usage_totals(get_current_month_summary())
+
+
+def aggregate_month(year, month):
+    """
+    Get cost, model breakdown and usage statistics for any calendar month.
+
+    Args:
+        year: Year (int)
+        month: Month (int, 1-12)
+
+    Returns:
+        Tuple of (total_cost, breakdown, stats), see aggregate_usage_totals
+    """
+    return aggregate_usage_totals(get_month_summary(year, month))
+
+
 def get_current_month_cost():
     """
     Get the total cost for the current calendar month.
@@ -45,8 +133,7 @@ def get_current_month_cost():
     Returns:
         Cost in dollars (float)
     """
-    records = get_current_month_usage()
-    return calculate_total_cost(records)
+    return calculate_summary_cost(get_current_month_summary())
 
 
 def determine_warning_level(current_cost, budget_limit):
@@ -95,27 +182,13 @@ def get_cost_breakdown(records):
     Get cost breakdown by model.
 
     Args:
-        records: List of usage records
+        records: Iterable of usage records
 
     Returns:
         Dict mapping model display names to costs
         Example: {"Sonnet": 10.50, "Haiku": 2.30}
     """
-    breakdown = {}
-
-    for record in records:
-        model = record.get("model")
-        usage = record.get("usage")
-
-        if model and usage:
-            cost = calculate_message_cost(model, usage)
-            display_name = get_model_display_name(model)
-
-            if display_name in breakdown:
-                breakdown[display_name] += cost
-            else:
-                breakdown[display_name] = cost
-
+    _, breakdown, _ = aggregate_usage_totals(summarize_records(records))
     return breakdown
 
 
@@ -124,7 +197,7 @@ def get_usage_stats(records):
     Get usage statistics from records.
 
     Args:
-        records: List of usage records
+        records: Iterable of usage records
 
     Returns:
         Dict with statistics:
@@ -134,21 +207,7 @@ def get_usage_stats(records):
         - total_cache_write_tokens: Total cache write tokens
         - total_cache_read_tokens: Total cache read tokens
     """
-    stats = {
-        "total_api_calls": len(records),
-        "total_input_tokens": 0,
-        "total_output_tokens": 0,
-        "total_cache_write_tokens": 0,
-        "total_cache_read_tokens": 0
-    }
-
-    for record in records:
-        usage = record.get("usage", {})
-        stats["total_input_tokens"] += usage.get("input_tokens", 0)
-        stats["total_output_tokens"] += usage.get("output_tokens", 0)
-        stats["total_cache_write_tokens"] += usage.get("cache_creation_input_tokens", 0)
-        stats["total_cache_read_tokens"] += usage.get("cache_read_input_tokens", 0)
-
+    _, _, stats = aggregate_usage_totals(summarize_records(records))
     return stats
 
 
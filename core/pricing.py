@@ -4,6 +4,9 @@ Pricing module for Claude Code cost calculations.
 Contains pricing constants and cost calculation functions.
 """
 
+from functools import lru_cache
+from operator import mul
+
 # Pricing per MTok (million tokens) as of January 2025
 PRICING = {
     "claude-sonnet-4-5-20250929": {
@@ -20,6 +23,18 @@ PRICING = {
     }
 }
 
+# Pricing per token as (input, output, cache_write, cache_read) tuples,
+# precomputed so per-message costs need no divisions or dict lookups
+PRICING_PER_TOKEN = {
+    model: (
+        prices["input"] / 1_000_000,
+        prices["output"] / 1_000_000,
+        prices["cache_write"] / 1_000_000,
+        prices["cache_read"] / 1_000_000
+    )
+    for model, prices in PRICING.items()
+}
+
 # Model aliases for normalization
 MODEL_ALIASES = {
     "claude-sonnet": "claude-sonnet-4-5-20250929",
@@ -29,6 +44,7 @@ MODEL_ALIASES = {
 }
 
 
+@lru_cache(maxsize=32)
 def normalize_model_name(model):
     """
     Normalize model name to full model ID.
@@ -76,37 +92,46 @@ def calculate_message_cost(model, usage):
     Returns:
         Cost in dollars (float)
     """
-    # Normalize model name
-    normalized_model = normalize_model_name(model)
-
-    # Get pricing for this model
-    pricing = PRICING.get(normalized_model)
+    # Get per-token pricing for this model
+    pricing = PRICING_PER_TOKEN.get(normalize_model_name(model))
     if not pricing:
         # Fallback to Sonnet pricing if unknown
-        pricing = PRICING["claude-sonnet-4-5-20250929"]
+        pricing = PRICING_PER_TOKEN["claude-sonnet-4-5-20250929"]
 
-    # Calculate cost for each token type
-    cost = 0.0
+    input_price, output_price, cache_write_price, cache_read_price = pricing
 
-    # Regular input tokens
-    input_tokens = usage.get("input_tokens", 0)
-    cost += (input_tokens / 1_000_000) * pricing["input"]
+    return (
+        input_price * usage.get("input_tokens", 0)
+        + output_price * usage.get("output_tokens", 0)
+        + cache_write_price * usage.get("cache_creation_input_tokens", 0)
+        + cache_read_price * usage.get("cache_read_input_tokens", 0)
+    )
+
+
+def calculate_tokens_cost(model, token_counts):
+    """
+    Calculate cost for token counts summed over any number of messages.
 
-    # Output tokens
-    output_tokens = usage.get("output_tokens", 0)
-    cost += (output_tokens / 1_000_000) * pricing["output"]
+    Cost is linear in token counts, so pricing a model's summed tokens
+    is a single dot product with its per-token prices.
 
-    # Cache write tokens (creating cache)
-    cache_write_tokens = usage.get("cache_creation_input_tokens", 0)
-    cost += (cache_write_tokens / 1_000_000) * pricing["cache_write"]
+    Args:
+        model: Model ID (e.g., "claude-sonnet-4-5-20250929")
+        token_counts: Sequence of (input, output, cache_write, cache_read)
+            token counts
 
-    # Cache read tokens (reading from cache)
-    cache_read_tokens = usage.get("cache_read_input_tokens", 0)
-    cost += (cache_read_tokens / 1_000_000) * pricing["cache_read"]
+    Returns:
+        Cost in dollars (float)
+    """
+    pricing = PRICING_PER_TOKEN.get(normalize_model_name(model))
+    if not pricing:
+        # Fallback to Sonnet pricing if unknown
+        pricing = PRICING_PER_TOKEN["claude-sonnet-4-5-20250929"]
 
-    return cost
+    return sum(map(mul, pricing, token_counts))
 
 
+@lru_cache(maxsize=32)
 def get_model_display_name(model):
     """
     Get a friendly display name for a model.
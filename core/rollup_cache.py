@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Rollup cache module for per-month cost totals.
+Past months never change, so their totals are computed once and stored.
+"""
+
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+# Add parent directory to path to import sibling modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.cost_calculator import aggregate_current_month, aggregate_month
+from core.state_manager import write_json_file
+from core.usage_parser import month_prefix
+
+
+# Rollup file location
+ROLLUP_FILE = os.path.expanduser("~/.claude/cost_guardrails_monthly.json")
+ROLLUP_VERSION = 2
+
+# Usage statistics every stored rollup must carry (see get_usage_stats)
+ROLLUP_STATS_KEYS = (
+    "total_api_calls",
+    "total_input_tokens",
+    "total_output_tokens",
+    "total_cache_write_tokens",
+    "total_cache_read_tokens"
+)
+
+
+def load_rollups():
+    """
+    Load stored monthly rollups.
+
+    Returns:
+        Dict mapping month strings (YYYY-MM format) to rollups, each with
+        keys total_cost, breakdown and stats. Empty dict if the file is
+        missing, unreadable or outdated.
+    """
+    if not os.path.exists(ROLLUP_FILE):
+        return {}
+
+    try:
+        with open(ROLLUP_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        # Discard rollups written by a different version of the plugin
+        if not isinstance(data, dict) or data.get("version") != ROLLUP_VERSION:
+            return {}
+
+        months = data.get("months")
+        if not isinstance(months, dict):
+            return {}
+
+        return months
+
+    except (json.JSONDecodeError, IOError, PermissionError):
+        # If file is corrupted or unreadable, start from scratch
+        return {}
+    except Exception:
+        return {}
+
+
+def save_rollups(months):
+    """
+    Save monthly rollups.
+
+    Args:
+        months: Dict mapping month strings (YYYY-MM format) to rollups
+    """
+    data = {
+        "version": ROLLUP_VERSION,
+        "months": months
+    }
+
+    try:
+        write_json_file(ROLLUP_FILE, data, indent=2)
+    except (IOError, PermissionError):
+        # Fail silently if can't write
+        pass
+    except Exception:
+        pass
+
+
+def is_valid_rollup(rollup):
+    """
+    Check that a stored rollup has the shape get_month_rollup returns.
+
+    The rollup file may have been edited by hand or partly written by an
+    older version, so entries are checked before they are used.
+
+    Args:
+        rollup: Value stored for a month in the rollup file
+
+    Returns:
+        Boolean indicating whether the rollup can be used as is
+    """
+    if not isinstance(rollup, dict):
+        return False
+
+    total_cost = rollup.get("total_cost")
+    breakdown = rollup.get("breakdown")
+    stats = rollup.get("stats")
+
+    if isinstance(total_cost, bool) or not isinstance(total_cost, (int, float)):
+        return False
+    if not isinstance(breakdown, dict):
+        return False
+    if not isinstance(stats, dict):
+        return False
+
+    return all(isinstance(stats.get(key), int) for key in ROLLUP_STATS_KEYS)
+
+
+def get_month_rollup(year, month):
+    """
+    Get cost totals for a calendar month.
+
+    Completed months are served from the rollup file once computed. The
+    current month is always recomputed (through the parse cache) and
+    never stored, since it is still growing.
+
+    Records are bucketed by their UTC timestamps, so a month only counts
+    as completed once the UTC clock, minus the same one-day buffer used
+    for file mtimes, has moved past it. Until then the previous month
+    may still be collecting usage and is recomputed on every call.
+
+    Args:
+        year: Year (int)
+        month: Month (int, 1-12)
+
+    Returns:
+        Dict with keys:
+        - total_cost: Total cost in dollars (float)
+        - breakdown: Dict mapping model display names to costs
+        - stats: Usage statistics dict (see get_usage_stats)
+    """
+    month_str = month_prefix(year, month)
+    now = datetime.now()
+    current_month_str = month_prefix(now.year, now.month)
+
+    if month_str == current_month_str:
+        total_cost, breakdown, stats = aggregate_current_month()
+        return {
+            "total_cost": total_cost,
+            "breakdown": breakdown,
+            "stats": stats
+        }
+
+    months = load_rollups()
+    rollup = months.get(month_str)
+    if is_valid_rollup(rollup):
+        return rollup
+
+    total_cost, breakdown, stats = aggregate_month(year, month)
+    rollup = {
+        "total_cost": total_cost,
+        "breakdown": breakdown,
+        "stats": stats
+    }
+
+    # Only completed months are final; recent and future months may
+    # still get usage
+    settled = datetime.now(timezone.utc) - timedelta(days=1)
+    if month_str < month_prefix(settled.year, settled.month):
+        months[month_str] = rollup
+        save_rollups(months)
+
+    return rollup
@@ -4,6 +4,7 @@ State manager module for tracking warning state and preventing duplicates.
 Manages the state file that stores last shown warning level and timestamp.
 """
 
+import atexit
 import json
 import os
 from datetime import datetime
@@ -12,10 +13,43 @@ from datetime import datetime
 # State file location
 STATE_FILE = os.path.expanduser("~/.claude/cost_guardrails_state.json")
 
+# Parse cache location (per-file usage totals, kept next to the state file)
+PARSE_CACHE_FILE = os.path.expanduser("~/.claude/cost_guardrails_parse_cache.json")
+PARSE_CACHE_VERSION = 4
+
+# Warning levels in increasing order of severity
+LEVEL_RANK = {
+    "none": 0,
+    "50": 1,
+    "75": 2,
+    "90": 3,
+    "100": 4,
+    "125": 5
+}
+
+# In-process copy of the state; writes are deferred until flush_state()
+_state_cache = None
+_state_dirty = False
+
 
 def load_state():
     """
-    Load state from the state file.
+    Load state, reading the state file only once per process.
+
+    Returns:
+        State dict, see read_state_file
+    """
+    global _state_cache
+
+    if _state_cache is None:
+        _state_cache = read_state_file()
+
+    return _state_cache
+
+
+def read_state_file():
+    """
+    Read state from the state file.
 
     Returns:
         Dict with keys:
@@ -57,14 +91,132 @@ def load_state():
 
 def save_state(state):
     """
-    Save state to the state file.
+    Save state.
+
+    The state file is written once when the process exits (or when
+    flush_state is called), so several updates in one hook run cost a
+    single write.
 
     Args:
         state: Dict with state information
     """
+    global _state_cache, _state_dirty
+
+    _state_cache = state
+    _state_dirty = True
+
+
+def flush_state():
+    """
+    Write pending state changes to the state file.
+    Registered to run automatically at process exit.
+    """
+    global _state_dirty
+
+    if not _state_dirty:
+        return
+
     try:
-        with open(STATE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(state, f, indent=2)
+        write_json_file(STATE_FILE, _state_cache, indent=2)
+        _state_dirty = False
+    except (IOError, PermissionError):
+        # Fail silently if can't write
+        pass
+    except Exception:
+        pass
+
+
+atexit.register(flush_state)
+
+
+def write_json_file(path, data, indent=None):
+    """
+    Write data to a JSON file atomically.
+
+    Hooks from parallel sessions can run at the same time, so the data is
+    written to a temporary file next to the target and then moved into
+    place. Readers see either the old or the new file, never a partly
+    written one.
+
+    Args:
+        path: Path of the JSON file
+        data: JSON-serializable data
+        indent: Indentation passed to json.dumps (optional)
+
+    Raises:
+        IOError: If the file can't be written
+    """
+    # Unique per process, so concurrent writers don't share a temp file
+    temp_path = f"{path}.{os.getpid()}.tmp"
+
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, indent=indent))
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load_parse_cache():
+    """
+    Load the per-file parse cache.
+
+    Returns:
+        Dict mapping JSONL file paths to cache entries, each with keys:
+        - mtime: File modification time when it was parsed
+        - size: File size in bytes when it was parsed
+        - offset: Byte offset just past the last complete line parsed
+        - month: Month the totals cover (YYYY-MM format)
+        - fingerprint: Hex of the bytes just before offset, to tell
+          appends from in-place rewrites
+        - totals: Per-model token totals (see usage_parser)
+        - keys: Session IDs mapped to the message IDs counted in totals
+        - deduped: Totals after skipping messages counted in other
+          files, with a digest of those messages (only for such files)
+        Empty dict if the cache is missing, unreadable or outdated.
+    """
+    if not os.path.exists(PARSE_CACHE_FILE):
+        return {}
+
+    try:
+        with open(PARSE_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+
+        # Discard caches written by a different version of the plugin
+        if not isinstance(cache, dict) or cache.get("version") != PARSE_CACHE_VERSION:
+            return {}
+
+        files = cache.get("files")
+        if not isinstance(files, dict):
+            return {}
+
+        return files
+
+    except (json.JSONDecodeError, IOError, PermissionError):
+        # If file is corrupted or unreadable, start from scratch
+        return {}
+    except Exception:
+        return {}
+
+
+def save_parse_cache(files):
+    """
+    Save the per-file parse cache.
+
+    Args:
+        files: Dict mapping JSONL file paths to cache entries
+    """
+    cache = {
+        "version": PARSE_CACHE_VERSION,
+        "files": files
+    }
+
+    try:
+        write_json_file(PARSE_CACHE_FILE, cache)
     except (IOError, PermissionError):
         # Fail silently if can't write
         pass
@@ -97,17 +249,8 @@ def should_show_warning(current_level, current_month):
         return current_level != "none"
 
     # Same month - only show if level increased
-    level_hierarchy = ["none", "50", "75", "90", "100", "125"]
-
-    try:
-        current_idx = level_hierarchy.index(current_level)
-    except ValueError:
-        current_idx = 0
-
-    try:
-        last_idx = level_hierarchy.index(last_level)
-    except ValueError:
-        last_idx = 0
+    current_idx = LEVEL_RANK.get(current_level, 0)
+    last_idx = LEVEL_RANK.get(last_level, 0)
 
     # Show warning if we've moved to a higher level
     return current_idx > last_idx
@@ -4,11 +4,100 @@ Usage parser module for extracting token usage from Claude Code logs.
 Parses JSONL files in ~/.claude/projects/ to extract usage data.
 """
 
-import json
-import glob
 import os
+import sys
+from collections import deque
 from datetime import datetime
-from pathlib import Path
+from itertools import repeat
+
+# Add parent directory to path to import sibling modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.state_manager import load_parse_cache, save_parse_cache
+
+
+# Every line carrying message.usage contains this key; checking for it on
+# the raw bytes lets us skip json.loads for the vast majority of lines
+# (user turns, tool results, summaries) that can't contain usage data.
+USAGE_LINE_MARKER = b'"output_tokens"'
+
+# Inside JSON strings (e.g. a transcript quoting a log or source file)
+# the marker's quotes are escaped, so an occurrence preceded by this byte
+# is not a real key and doesn't make the line worth parsing
+ESCAPE_BYTE = ord("\\")
+
+# Upper bound on worker threads used to parse files concurrently
+MAX_PARSE_WORKERS = 8
+
+# Set this environment variable to parse with worker processes instead of
+# threads once there are at least PROCESS_POOL_MIN_FILES files to parse
+PROCESS_POOL_ENV_VAR = "COST_GUARDRAILS_PROCESS_POOL"
+PROCESS_POOL_MIN_FILES = 64
+
+# Read buffer for JSONL files; larger than the 8 KiB default so long
+# transcripts are read in few system calls
+READ_BUFFER_SIZE = 1 << 20
+
+# Bytes just before a file's cached offset, kept to check that the file
+# was appended to rather than rewritten before only its tail is parsed
+FINGERPRINT_SIZE = 64
+
+# JSON module used to parse log lines, imported on first use so runs that
+# are fully served from the parse cache never pay for it
+_json_module = None
+
+# Usage keys summed per model by summarize_jsonl_file, in totals order
+# (each totals list is [api_calls] followed by one sum per key)
+USAGE_TOKEN_KEYS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens"
+)
+
+def walk_jsonl_files(root, visited=None):
+    """
+    Recursively yield .jsonl files under a directory with their stats.
+
+    Uses os.scandir so each file is stat'ed exactly once during
+    discovery. Like glob, hidden files and directories are skipped and
+    symlinked directories are followed. Each directory is walked once,
+    so symlink cycles don't recurse forever.
+
+    Args:
+        root: Directory to search
+        visited: Set of (st_dev, st_ino) of directories already walked
+
+    Yields:
+        Tuples of (file_path, os.stat_result)
+    """
+    if visited is None:
+        visited = set()
+
+    try:
+        root_stat = os.stat(root)
+        entries = list(os.scandir(root))
+    except OSError:
+        # Directory vanished or can't be read
+        return
+
+    directory_id = (root_stat.st_dev, root_stat.st_ino)
+    if directory_id in visited:
+        return
+    visited.add(directory_id)
+
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+
+        try:
+            if entry.is_dir():
+                yield from walk_jsonl_files(entry.path, visited)
+            elif entry.name.endswith(".jsonl"):
+                yield entry.path, entry.stat()
+        except OSError:
+            # File vanished or can't be stat'ed - nothing to parse
+            continue
 
 
 def find_all_jsonl_files(base_path="~/.claude/projects"):
@@ -19,44 +108,237 @@ def find_all_jsonl_files(base_path="~/.claude/projects"):
         base_path: Base directory to search (default: ~/.claude/projects)
 
     Returns:
-        List of absolute file paths to .jsonl files
+        List of (file_path, os.stat_result) tuples for .jsonl files
     """
     expanded_path = os.path.expanduser(base_path)
 
     # Check if directory exists
-    if not os.path.exists(expanded_path):
+    if not os.path.isdir(expanded_path):
         return []
 
     # Find all .jsonl files recursively
-    pattern = os.path.join(expanded_path, "**", "*.jsonl")
-    return glob.glob(pattern, recursive=True)
+    return list(walk_jsonl_files(expanded_path))
+
+
+def filter_files_by_mtime(files, since_epoch):
+    """
+    Drop files that were last modified before a given point in time.
+
+    A JSONL file can only contain records written before its last
+    modification, so files older than the start of a month cannot hold
+    any usage for that month and never need to be parsed.
+
+    Args:
+        files: List of (file_path, os.stat_result) tuples
+        since_epoch: Cutoff as a POSIX timestamp (float)
+
+    Returns:
+        List of (file_path, os.stat_result) tuples modified at or after
+        the cutoff
+    """
+    return [
+        (file_path, stat) for file_path, stat in files
+        if stat.st_mtime >= since_epoch
+    ]
+
+
+def get_month_start_epoch(year, month):
+    """
+    Get the mtime cutoff for files that may contain usage in a month.
+
+    The cutoff is the start of the month minus one day, so records
+    timestamped in UTC are not lost to local timezone offsets.
+
+    Args:
+        year: Year (int)
+        month: Month (int, 1-12)
+
+    Returns:
+        POSIX timestamp (float)
+    """
+    return datetime(year, month, 1).timestamp() - 86400
+
+
+def get_json_module():
+    """
+    Get the JSON module used to parse JSONL lines, importing it if needed.
+
+    orjson is optional: it parses JSONL lines several times faster and
+    provides the same loads()/JSONDecodeError interface used here. The
+    standard library json module is used when it isn't installed.
+
+    Returns:
+        orjson or json module
+    """
+    global _json_module
+
+    if _json_module is None:
+        try:
+            import orjson as module
+        except ImportError:
+            import json as module
+        _json_module = module
+
+    return _json_module
+
+
+def create_parse_executor(file_count):
+    """
+    Create the executor used to parse a set of files concurrently.
+
+    Uses a thread pool, or a process pool when the
+    COST_GUARDRAILS_PROCESS_POOL environment variable is set and there
+    are at least PROCESS_POOL_MIN_FILES files.
+
+    Args:
+        file_count: Total number of files that will be parsed
+
+    Returns:
+        Tuple of (executor, workers)
+    """
+    # concurrent.futures is slow to import, so only load it when needed
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    workers = min(MAX_PARSE_WORKERS, os.cpu_count() or 1, file_count)
+
+    executor_class = ThreadPoolExecutor
+    if os.environ.get(PROCESS_POOL_ENV_VAR) and file_count >= PROCESS_POOL_MIN_FILES:
+        executor_class = ProcessPoolExecutor
+
+    return executor_class(max_workers=workers), workers
+
+
+def map_jsonl_files(func, file_paths, *iterables):
+    """
+    Apply a parsing function to many files concurrently.
+
+    Works like the built-in map(). Files are handed to a thread pool, or
+    to a process pool when the COST_GUARDRAILS_PROCESS_POOL environment
+    variable is set and there are many files. A single file is parsed
+    inline.
+
+    Args:
+        func: Function called as func(file_path, *per_file_args)
+        file_paths: List of file paths
+        *iterables: Extra per-file arguments (use itertools.repeat
+            for arguments shared by every call)
+
+    Returns:
+        List of results, in the same order as file_paths
+    """
+    if len(file_paths) <= 1:
+        return list(map(func, file_paths, *iterables))
+
+    executor, _ = create_parse_executor(len(file_paths))
+    with executor:
+        return list(executor.map(func, file_paths, *iterables))
 
 
-def parse_jsonl_file(file_path):
+def imap_jsonl_files(func, file_paths, *iterables):
+    """
+    Lazily apply a parsing function to many files concurrently.
+
+    Like map_jsonl_files, but yields results as they are needed. A single
+    executor is used for all files, with at most two files per worker
+    submitted ahead of the consumer, so only a few results are held in
+    memory at a time.
+
+    Args:
+        func: Function called as func(file_path, *per_file_args)
+        file_paths: List of file paths
+        *iterables: Extra per-file arguments (use itertools.repeat
+            for arguments shared by every call)
+
+    Yields:
+        Results, in the same order as file_paths
+    """
+    if len(file_paths) <= 1:
+        yield from map(func, file_paths, *iterables)
+        return
+
+    executor, workers = create_parse_executor(len(file_paths))
+    with executor:
+        pending = deque()
+
+        for args in zip(file_paths, *iterables):
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+            pending.append(executor.submit(func, *args))
+
+        while pending:
+            yield pending.popleft().result()
+
+
+def is_usage_line(line):
+    """
+    Check on raw bytes whether a JSONL line may carry message.usage data.
+
+    The line must contain the usage marker as an actual JSON key, not
+    only inside a string value where its quotes are escaped.
+
+    Args:
+        line: Raw line from a JSONL file (bytes)
+
+    Returns:
+        Boolean indicating whether the line is worth parsing
+    """
+    index = line.find(USAGE_LINE_MARKER)
+    while index > 0 and line[index - 1] == ESCAPE_BYTE:
+        index = line.find(USAGE_LINE_MARKER, index + 1)
+
+    return index >= 0
+
+
+def parse_jsonl_file(file_path, since=None, until=None):
     """
     Parse a single JSONL file and extract usage records.
 
-    Each line in the JSONL file is a JSON object. We look for objects
-    with message.usage data and extract relevant information.
+    See iter_jsonl_records for details.
 
     Args:
         file_path: Path to the .jsonl file
+        since: First month to include, "YYYY-MM" (inclusive, optional)
+        until: Last month to include, "YYYY-MM" (inclusive, optional)
 
     Returns:
-        List of usage records, each dict with:
+        List of usage records
+    """
+    return list(iter_jsonl_records(file_path, since, until))
+
+
+def iter_jsonl_records(file_path, since=None, until=None):
+    """
+    Lazily parse a single JSONL file, yielding usage records.
+
+    Each line in the JSONL file is a JSON object. We look for objects
+    with message.usage data and extract relevant information. Lines
+    without the usage marker are skipped before being decoded.
+
+    When since/until are given, records are filtered by the YYYY-MM
+    prefix of their ISO 8601 timestamp while parsing, so out-of-range
+    records are never built. Records without a timestamp are dropped
+    whenever a range is given.
+
+    Args:
+        file_path: Path to the .jsonl file
+        since: First month to include, "YYYY-MM" (inclusive, optional)
+        until: Last month to include, "YYYY-MM" (inclusive, optional)
+
+    Yields:
+        Usage records, each dict with:
             - timestamp: ISO 8601 timestamp string
             - model: Model ID
             - usage: Dict with token counts
             - session_id: Session ID (if available)
+            - message_id: API message ID (if available)
     """
-    records = []
+    json = get_json_module()
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
             for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue  # Skip empty lines
+                if not is_usage_line(line):
+                    continue  # Skip lines that can't contain usage
 
                 try:
                     entry = json.loads(line)
@@ -66,16 +348,29 @@ def parse_jsonl_file(file_path):
                     usage = message.get("usage")
 
                     # Only include entries with usage data
-                    if usage:
-                        record = {
-                            "timestamp": entry.get("timestamp"),
-                            "model": message.get("model"),
-                            "usage": usage,
-                            "session_id": entry.get("sessionId"),
-                            "file_path": file_path,
-                            "line_number": line_num
-                        }
-                        records.append(record)
+                    if not usage:
+                        continue
+
+                    # Filter by month on the timestamp string itself
+                    if since or until:
+                        timestamp = entry.get("timestamp")
+                        if not isinstance(timestamp, str):
+                            continue
+                        month_str = timestamp[:7]
+                        if since and month_str < since:
+                            continue
+                        if until and month_str > until:
+                            continue
+
+                    record = {
+                        "timestamp": entry.get("timestamp"),
+                        "model": message.get("model"),
+                        "usage": usage,
+                        "session_id": entry.get("sessionId"),
+                        "message_id": message.get("id"),
+                        "file_path": file_path,
+                        "line_number": line_num
+                    }
 
                 except json.JSONDecodeError as e:
                     # Skip malformed JSON lines
@@ -84,6 +379,8 @@ def parse_jsonl_file(file_path):
                     # Skip lines with other errors
                     continue
 
+                yield record
+
     except (IOError, FileNotFoundError, PermissionError):
         # Skip files that can't be read
         pass
@@ -91,7 +388,279 @@ def parse_jsonl_file(file_path):
         # Skip any other errors
         pass
 
-    return records
+
+def summarize_jsonl_file(file_path, month, offset=0, seen=()):
+    """
+    Sum token usage per model for one month from a single JSONL file.
+
+    Unlike parse_jsonl_file, no per-message records are built. Parsing
+    starts at the given byte offset so that only data appended since a
+    previous call needs to be read.
+
+    A last line without a trailing newline is counted if it parses, but
+    the returned offset stays before it: it may still be being written
+    to, and when it is read again its message key dedupes it. Such a
+    line without a message ID can't be deduped, so the offset moves
+    past it once it has been counted.
+
+    The same assistant message can be logged more than once (e.g. when
+    a session is resumed or forked), so each (session ID, message ID)
+    pair is only counted once.
+
+    Args:
+        file_path: Path to the .jsonl file
+        month: Month to include, "YYYY-MM"
+        offset: Byte offset to start reading from (default: 0)
+        seen: Message keys already counted elsewhere, to skip
+
+    Returns:
+        Tuple of (totals, end_offset, keys)
+        - totals: Dict mapping model ID ("" if missing) to a list of
+          [api_calls, input, output, cache_write, cache_read] counts
+        - end_offset: Byte offset to resume reading from
+        - keys: Set of (session ID, message ID) tuples counted, with ""
+          for a missing session ID
+    """
+    totals = {}
+    keys = set()
+    end_offset = offset
+
+    # This loop is the plugin's hot path: bind everything it uses to
+    # locals, and reject lines on raw bytes before decoding them. A line
+    # whose timestamp falls in the month must contain '"YYYY-MM'.
+    loads = get_json_module().loads
+    usage_marker = USAGE_LINE_MARKER
+    escape_byte = ESCAPE_BYTE
+    month_marker = b'"' + month.encode("ascii")
+
+    try:
+        with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+            f.seek(offset)
+            for line in f:
+                # Only the last line can lack a newline
+                terminated = line[-1:] == b"\n"
+                if terminated:
+                    end_offset += len(line)
+
+                # Find the first unescaped usage marker (see is_usage_line)
+                index = line.find(usage_marker)
+                while index > 0 and line[index - 1] == escape_byte:
+                    index = line.find(usage_marker, index + 1)
+
+                if index < 0 or month_marker not in line:
+                    continue  # Skip lines that can't contain usage
+
+                try:
+                    entry = loads(line)
+
+                    message = entry.get("message", {})
+                    usage = message.get("usage")
+                    if not usage:
+                        continue
+
+                    timestamp = entry.get("timestamp")
+                    if not isinstance(timestamp, str) or timestamp[:7] != month:
+                        continue
+
+                    # Count each message once
+                    message_id = message.get("id")
+                    if message_id:
+                        key = (entry.get("sessionId") or "", message_id)
+                        if key in keys or key in seen:
+                            continue
+                        keys.add(key)
+                    elif not terminated:
+                        # Can't be deduped if read again, so move past it
+                        end_offset += len(line)
+
+                    model = message.get("model") or ""
+                    counts = totals.get(model)
+                    if counts is None:
+                        counts = totals[model] = [0, 0, 0, 0, 0]
+
+                    get = usage.get
+                    counts[0] += 1
+                    counts[1] += get("input_tokens", 0)
+                    counts[2] += get("output_tokens", 0)
+                    counts[3] += get("cache_creation_input_tokens", 0)
+                    counts[4] += get("cache_read_input_tokens", 0)
+
+                except Exception:
+                    # Skip malformed JSON lines and lines with other errors
+                    continue
+
+    except (IOError, FileNotFoundError, PermissionError):
+        # Skip files that can't be read
+        pass
+    except Exception:
+        # Skip any other errors
+        pass
+
+    return totals, end_offset, keys
+
+
+def get_overlap_digest(keys):
+    """
+    Identify a set of message keys with a short, stable digest.
+
+    Args:
+        keys: Iterable of (session ID, message ID) tuples
+
+    Returns:
+        Hex digest string, the same for equal sets in any order
+    """
+    # Only needed when files share messages, so import on first use
+    import hashlib
+
+    text = "\n".join(f"{session_id}\t{message_id}" for session_id, message_id in sorted(keys))
+
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def merge_file_summaries(summaries, month, deduped=None):
+    """
+    Combine per-file usage totals, counting each message only once.
+
+    Each file's totals are deduplicated within that file only. If a file
+    shares messages with a file merged before it, it is parsed again
+    skipping the messages already counted.
+
+    The totals of such a reparse only depend on the file and on which of
+    its messages were already counted, so they can be kept in deduped
+    and reused as long as both stay the same.
+
+    Args:
+        summaries: List of (file_path, totals, keys) tuples, see
+            summarize_jsonl_file
+        month: Month the totals cover, "YYYY-MM"
+        deduped: Dict mapping file paths to {"overlap": digest, "totals":
+            totals} from earlier calls, updated in place (optional)
+
+    Returns:
+        Totals dict, see summarize_jsonl_file
+    """
+    month_totals = {}
+    seen = set()
+
+    for file_path, totals, keys in summaries:
+        overlap = seen.intersection(keys)
+
+        if overlap:
+            digest = get_overlap_digest(overlap)
+            cached = deduped.get(file_path) if deduped is not None else None
+
+            if cached and cached.get("overlap") == digest:
+                totals = cached["totals"]
+            else:
+                totals, _, _ = summarize_jsonl_file(file_path, month, 0, overlap)
+                if deduped is not None:
+                    deduped[file_path] = {"overlap": digest, "totals": totals}
+        elif deduped is not None:
+            deduped.pop(file_path, None)
+
+        merge_usage_totals(month_totals, totals)
+        seen.update(keys)
+
+    return month_totals
+
+
+def deduplicate_records(records):
+    """
+    Drop repeated log entries for the same assistant message.
+
+    Args:
+        records: Iterable of usage records
+
+    Every key seen is remembered until the iteration ends, since a
+    message can be logged again in any later file.
+
+    Yields:
+        Usage records with each (session ID, message ID) pair kept once,
+        in their original order
+    """
+    seen = set()
+
+    for record in records:
+        message_id = record.get("message_id")
+        if message_id:
+            key = (record.get("session_id"), message_id)
+            if key in seen:
+                continue
+            seen.add(key)
+
+        yield record
+
+
+def iter_files_records(file_paths, since=None, until=None):
+    """
+    Lazily parse many JSONL files, yielding their usage records.
+
+    Files are parsed concurrently, with only a few files worth of
+    records held in memory at a time (see imap_jsonl_files).
+
+    Args:
+        file_paths: List of file paths
+        since: First month to include, "YYYY-MM" (inclusive, optional)
+        until: Last month to include, "YYYY-MM" (inclusive, optional)
+
+    Yields:
+        Usage records, see iter_jsonl_records
+    """
+    results = imap_jsonl_files(
+        parse_jsonl_file, file_paths, repeat(since), repeat(until)
+    )
+
+    for records in results:
+        yield from records
+
+
+def summarize_records(records):
+    """
+    Sum token usage per model from a list of usage records.
+
+    Args:
+        records: Iterable of usage records (each with 'model' and 'usage' keys)
+
+    Returns:
+        Totals dict, see summarize_jsonl_file
+    """
+    totals = {}
+
+    for record in records:
+        usage = record.get("usage") or {}
+        model = record.get("model") or ""
+
+        counts = totals.get(model)
+        if counts is None:
+            counts = totals[model] = [0, 0, 0, 0, 0]
+
+        counts[0] += 1
+        for i, key in enumerate(USAGE_TOKEN_KEYS, 1):
+            counts[i] += usage.get(key, 0)
+
+    return totals
+
+
+def merge_usage_totals(target, totals):
+    """
+    Add per-model usage totals into another totals dict in place.
+
+    Args:
+        target: Totals dict to update
+        totals: Totals dict to add (see summarize_jsonl_file)
+
+    Returns:
+        The updated target dict
+    """
+    for model, counts in totals.items():
+        existing = target.get(model)
+        if existing is None:
+            target[model] = list(counts)
+        else:
+            for i, count in enumerate(counts):
+                existing[i] += count
+
+    return target
 
 
 def parse_timestamp(timestamp_str):
@@ -118,6 +687,20 @@ def parse_timestamp(timestamp_str):
         return None
 
 
+def month_prefix(year, month):
+    """
+    Get the YYYY-MM prefix shared by ISO 8601 timestamps in a month.
+
+    Args:
+        year: Year (int)
+        month: Month (int, 1-12)
+
+    Returns:
+        String in YYYY-MM format (e.g., "2026-01")
+    """
+    return f"{year:04d}-{month:02d}"
+
+
 def filter_records_by_month(records, year, month):
     """
     Filter usage records to a specific calendar month.
@@ -130,13 +713,14 @@ def filter_records_by_month(records, year, month):
     Returns:
         Filtered list of records from the specified month
     """
+    month_str = month_prefix(year, month)
     filtered = []
 
+    # ISO 8601 timestamps start with YYYY-MM, so no datetime is needed
     for record in records:
         timestamp_str = record.get("timestamp")
-        dt = parse_timestamp(timestamp_str)
 
-        if dt and dt.year == year and dt.month == month:
+        if isinstance(timestamp_str, str) and timestamp_str[:7] == month_str:
             filtered.append(record)
 
     return filtered
@@ -146,32 +730,226 @@ def get_current_month_usage():
     """
     Get all usage records for the current calendar month.
 
-    This is the main function to call for getting current month's data.
-    It finds all JSONL files, parses them, and filters to current month.
-
     Returns:
         List of usage records for the current month
     """
+    return list(iter_current_month_usage())
+
+
+def iter_current_month_usage():
+    """
+    Lazily get all usage records for the current calendar month.
+
+    This is the main function to call for getting current month's data.
+    It finds recently modified JSONL files and parses them, keeping only
+    records from the current month.
+
+    Yields:
+        Usage records for the current month
+    """
     # Get current year and month
     now = datetime.now()
     current_year = now.year
     current_month = now.month
 
-    # Find all JSONL files
-    all_files = find_all_jsonl_files()
+    # Find JSONL files that may have been written to this month
+    recent_files = filter_files_by_mtime(
+        find_all_jsonl_files(),
+        get_month_start_epoch(current_year, current_month)
+    )
+    all_files = [file_path for file_path, _ in recent_files]
+
+    # Parse all files, keeping only current month records
+    month_str = month_prefix(current_year, current_month)
+    records = iter_files_records(all_files, month_str, month_str)
+
+    yield from deduplicate_records(records)
+
+
+def keys_from_cache(sessions):
+    """
+    Rebuild message keys from their parse cache representation.
+
+    Args:
+        sessions: Dict mapping session IDs to lists of message IDs
+
+    Returns:
+        Set of (session ID, message ID) tuples
+    """
+    return {
+        (session_id, message_id)
+        for session_id, message_ids in sessions.items()
+        for message_id in message_ids
+    }
+
+
+def read_file_fingerprint(file_path, offset):
+    """
+    Read the bytes just before an offset, to detect rewritten files.
+
+    Args:
+        file_path: Path to the .jsonl file
+        offset: Byte offset parsing stopped at
+
+    Returns:
+        Up to FINGERPRINT_SIZE bytes before offset as a hex string, or
+        None if the file can't be read
+    """
+    start = max(0, offset - FINGERPRINT_SIZE)
+
+    try:
+        with open(file_path, 'rb') as f:
+            f.seek(start)
+            return f.read(offset - start).hex()
+    except (IOError, FileNotFoundError, PermissionError):
+        return None
+    except Exception:
+        return None
 
-    # Parse all files and collect records
-    all_records = []
-    for file_path in all_files:
-        records = parse_jsonl_file(file_path)
-        all_records.extend(records)
 
-    # Filter to current month
-    current_month_records = filter_records_by_month(
-        all_records, current_year, current_month
+def get_current_month_summary():
+    """
+    Get per-model usage totals for the current calendar month.
+
+    Results are cached per file in the parse cache, keyed on the file's
+    mtime and size. Unchanged files are not read at all, and files that
+    have only grown since the last run are parsed from where the
+    previous run stopped. A file counts as grown only if the bytes just
+    before that point are still the same; otherwise it was rewritten
+    and is parsed again in full.
+
+    Returns:
+        Dict mapping model ID to [api_calls, input, output, cache_write,
+        cache_read] counts (see summarize_jsonl_file)
+    """
+    now = datetime.now()
+    month_str = month_prefix(now.year, now.month)
+    since_epoch = get_month_start_epoch(now.year, now.month)
+
+    cache = load_parse_cache()
+    new_cache = {}
+
+    # Work out which files need parsing, and from which offset
+    pending_paths = []
+    pending_offsets = []
+    pending_seen = []
+
+    # Deduplicated totals of files that share messages with other files
+    deduped = {}
+
+    # Files untouched since the month began can't hold its usage
+    recent_files = filter_files_by_mtime(find_all_jsonl_files(), since_epoch)
+
+    for file_path, stat in recent_files:
+        entry = cache.get(file_path)
+        if entry and entry.get("month") != month_str:
+            entry = None
+
+        if entry and entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+            # Unchanged since last run
+            totals = entry["totals"]
+            offset = entry["offset"]
+            keys = entry["keys"]
+            if entry.get("deduped"):
+                deduped[file_path] = entry["deduped"]
+        elif (entry and entry["size"] < stat.st_size
+                and entry.get("fingerprint") == read_file_fingerprint(file_path, entry["offset"])):
+            # Appended to since last run - only parse the new bytes
+            totals = entry["totals"]
+            offset = entry["offset"]
+            keys = {
+                session_id: list(message_ids)
+                for session_id, message_ids in entry["keys"].items()
+            }
+            pending_paths.append(file_path)
+            pending_offsets.append(offset)
+            pending_seen.append(keys_from_cache(keys))
+        else:
+            # New, or rewritten in place - parse the whole file
+            totals = {}
+            offset = 0
+            keys = {}
+            pending_paths.append(file_path)
+            pending_offsets.append(offset)
+            pending_seen.append(set())
+
+        new_cache[file_path] = {
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "offset": offset,
+            "month": month_str,
+            "fingerprint": entry.get("fingerprint") if entry else None,
+            "totals": totals,
+            "keys": keys
+        }
+
+    # Parse new data in all pending files concurrently
+    results = map_jsonl_files(
+        summarize_jsonl_file, pending_paths, repeat(month_str),
+        pending_offsets, pending_seen
+    )
+    for file_path, (tail, offset, keys) in zip(pending_paths, results):
+        entry = new_cache[file_path]
+        merge_usage_totals(entry["totals"], tail)
+        entry["offset"] = offset
+        entry["fingerprint"] = read_file_fingerprint(file_path, offset)
+        for session_id, message_id in keys:
+            entry["keys"].setdefault(session_id, []).append(message_id)
+
+    # Combine files, counting messages logged in several files once.
+    # Deduplicated totals are reused while a file and its overlap with
+    # the files before it stay the same.
+    month_totals = merge_file_summaries(
+        [
+            (file_path, entry["totals"], keys_from_cache(entry["keys"]))
+            for file_path, entry in new_cache.items()
+        ],
+        month_str,
+        deduped
     )
+    for file_path, entry in new_cache.items():
+        if file_path in deduped:
+            entry["deduped"] = deduped[file_path]
+
+    if new_cache != cache:
+        save_parse_cache(new_cache)
+
+    return month_totals
+
+
+def get_month_summary(year, month):
+    """
+    Get per-model usage totals for a specific calendar month.
+
+    Unlike get_current_month_summary, this does not use the parse cache,
+    which only tracks the current month.
 
-    return current_month_records
+    Args:
+        year: Year (int)
+        month: Month (int, 1-12)
+
+    Returns:
+        Totals dict, see summarize_jsonl_file
+    """
+    month_str = month_prefix(year, month)
+
+    recent_files = filter_files_by_mtime(
+        find_all_jsonl_files(),
+        get_month_start_epoch(year, month)
+    )
+    all_files = [file_path for file_path, _ in recent_files]
+
+    results = map_jsonl_files(
+        summarize_jsonl_file, all_files, repeat(month_str), repeat(0)
+    )
+
+    return merge_file_summaries(
+        [
+            (file_path, totals, keys)
+            for file_path, (totals, _, keys) in zip(all_files, results)
+        ],
+        month_str
+    )
 
 
 def get_usage_for_month(year, month):
@@ -185,19 +963,32 @@ def get_usage_for_month(year, month):
     Returns:
         List of usage records for the specified month
     """
-    # Find all JSONL files
-    all_files = find_all_jsonl_files()
+    return list(iter_usage_for_month(year, month))
 
-    # Parse all files and collect records
-    all_records = []
-    for file_path in all_files:
-        records = parse_jsonl_file(file_path)
-        all_records.extend(records)
 
-    # Filter to specified month
-    month_records = filter_records_by_month(all_records, year, month)
+def iter_usage_for_month(year, month):
+    """
+    Lazily get all usage records for a specific calendar month.
 
-    return month_records
+    Args:
+        year: Year (int)
+        month: Month (int, 1-12)
+
+    Yields:
+        Usage records for the specified month
+    """
+    # Find JSONL files that may have been written to this month
+    recent_files = filter_files_by_mtime(
+        find_all_jsonl_files(),
+        get_month_start_epoch(year, month)
+    )
+    all_files = [file_path for file_path, _ in recent_files]
+
+    # Parse all files, keeping only the specified month's records
+    month_str = month_prefix(year, month)
+    records = iter_files_records(all_files, month_str, month_str)
+
+    yield from deduplicate_records(records)
 
 
 def get_all_usage():
@@ -207,11 +998,21 @@ def get_all_usage():
     Returns:
         List of all usage records
     """
-    all_files = find_all_jsonl_files()
+    return list(iter_all_usage())
+
+
+def iter_all_usage():
+    """
+    Lazily get all usage records from all JSONL files.
 
-    all_records = []
-    for file_path in all_files:
-        records = parse_jsonl_file(file_path)
-        all_records.extend(records)
+    Records are streamed rather than collected, so they are not all held
+    in memory at once. The (session ID, message ID) keys used to drop
+    duplicates are still kept for the whole history, so memory use does
+    grow with it, though far more slowly than a list of records.
+
+    Yields:
+        Usage records
+    """
+    all_files = [file_path for file_path, _ in find_all_jsonl_files()]
 
-    return all_records
+    yield from deduplicate_records(iter_files_records(all_files))
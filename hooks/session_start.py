@@ -12,22 +12,12 @@ import os
 PLUGIN_ROOT = os.environ.get('CLAUDE_PLUGIN_ROOT', os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, PLUGIN_ROOT)
 
-from core.cost_calculator import (
-    get_current_month_cost,
-    determine_warning_level,
-    format_warning_message,
-    get_cost_breakdown
-)
-from core.usage_parser import get_current_month_usage
-from core.state_manager import (
-    should_show_warning,
-    update_warning_shown,
-    get_current_month_string
-)
-
 # Budget configuration
 BUDGET_LIMIT = 15.00  # $15 per month
 
+# Claude Code usage logs
+PROJECTS_DIR = os.path.expanduser("~/.claude/projects")
+
 
 def main():
     """Main entry point for SessionStart hook."""
@@ -38,21 +28,34 @@ def main():
         except:
             input_data = {}
 
+        # No usage logs yet - nothing to warn about
+        if not os.path.isdir(PROJECTS_DIR):
+            return
+
+        # Import plugin modules only once there is work to do
+        from core.cost_calculator import (
+            aggregate_current_month,
+            determine_warning_level,
+            format_warning_message
+        )
+        from core.state_manager import (
+            should_show_warning,
+            update_warning_shown,
+            get_current_month_string
+        )
+
         # Get current month
         current_month = get_current_month_string()
 
-        # Calculate current spending
-        current_cost = get_current_month_cost()
+        # Calculate current spending and breakdown
+        current_cost, breakdown, _ = aggregate_current_month()
 
         # Determine warning level
         warning_level, percentage = determine_warning_level(current_cost, BUDGET_LIMIT)
 
-        # Check if we should show warning
-        if should_show_warning(warning_level, current_month):
-            # Get usage records and breakdown
-            records = get_current_month_usage()
-            breakdown = get_cost_breakdown(records)
-
+        # Check if we should show warning (below 50% there is never one,
+        # so skip reading the state file)
+        if warning_level != "none" and should_show_warning(warning_level, current_month):
             # Format warning message
             message = format_warning_message(warning_level, current_cost, BUDGET_LIMIT, breakdown)
 
@@ -7,17 +7,11 @@ Shows session summary when Claude Code session ends.
 import json
 import sys
 import os
-``
+
 # Add plugin root to path
 PLUGIN_ROOT = os.environ.get('CLAUDE_PLUGIN_ROOT', os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, PLUGIN_ROOT)
 
-from core.cost_calculator import (``
-    get_current_month_cost,
-    format_summary_message
-)
-from core.state_manager import update_cost_check
-
 # Budget configuration
 BUDGET_LIMIT = 15.00  # $15 per month
 
@@ -31,8 +25,15 @@ def main():
         except:
             input_data = {}
 
+        # Import plugin modules inside the try so failures stay silent
+        from core.cost_calculator import (
+            aggregate_current_month,
+            format_summary_message
+        )
+        from core.state_manager import update_cost_check
+
         # Calculate current cost
-        current_cost = get_current_month_cost()
+        current_cost, _, _ = aggregate_current_month()
 
         # Update state (record that we checked)
         update_cost_check()